@@ -92,6 +92,36 @@ def jacobian(func):
     return jacfwd(func)
 
 
+def jacobian_vec(func, point_ndim=1):
+    """Return a function that returns the jacobian of func.
+
+    Forward-mode differentiation is used, as the functions differentiated
+    in geomstats map low-dimensional points to small tensors. Batches of
+    points are handled with vmap instead of a for-loop.
+
+    Parameters
+    ----------
+    func : callable
+        Function whose jacobian is computed.
+    point_ndim : int
+        Number of dimensions of a single point.
+
+    Returns
+    -------
+    _ : callable
+        Function taking point as input and returning
+        the jacobian of func at point.
+    """
+    jac = jacfwd(func)
+
+    def _jac(x):
+        if x.ndim == point_ndim:
+            return jac(x)
+        return vmap(jac)(x)
+
+    return _jac
+
+
 def value_and_grad(func, to_numpy=False):
     """Wrap autograd value_and_grad function."""
 
@@ -119,7 +149,6 @@ def value_and_grad(func, to_numpy=False):
 unsupported_functions = [
     'hessian',
     'hessian_vec',
-    'jacobian_vec',
     'jacobian_and_hessian',
     'value_jacobian_and_hessian',
 ]
@@ -171,6 +171,32 @@ class EuclideanMetric(RiemannianMetric):
         gamma = gs.zeros(shape)
         return repeat_out(self._space.point_ndim, gamma, base_point, out_shape=shape)
 
+    def riemann_tensor(self, base_point=None):
+        """Compute Riemannian tensor at base_point.
+
+        The metric is flat, hence the tensor vanishes everywhere.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., dim]
+            Point on the manifold.
+
+        Returns
+        -------
+        riemann_curvature : array-like, shape=[..., dim, dim, dim, dim]
+            Riemannian tensor curvature.
+        """
+        if self._space.point_ndim > 1:
+            raise NotImplementedError(
+                "Riemann tensor not implemented for manifolds with points of ndim > 1."
+            )
+
+        dim = self._space.dim
+        shape = (dim, dim, dim, dim)
+        return repeat_out(
+            self._space.point_ndim, gs.zeros(shape), base_point, out_shape=shape
+        )
+
     def exp(self, tangent_vec, base_point):
         """Compute exp map of a base point in tangent vector direction.
 
@@ -366,7 +392,7 @@ class CanonicalEuclideanMetric(EuclideanMetric):
         inner_product : array-like, shape=[...,]
             Inner-product.
         """
-        inner_product = gs.einsum('ij,ij->i', tangent_vec_a, tangent_vec_b)
+        inner_product = gs.dot(tangent_vec_a, tangent_vec_b)
         return repeat_out(
             self._space.point_ndim,
             inner_product,
@@ -4,10 +4,10 @@ Lead author: Nina Miolane.
 """
 
 import geomstats.backend as gs
+import geomstats.geometry as geometry
 from geomstats.geometry.riemannian_metric import RiemannianMetric
 from geomstats.numerics.geodesic import ExpODESolver, LogShootingSolver
 from geomstats.numerics.ivp import GSIVPIntegrator
-from geomstats.vectorization import check_is_batch
 
 
 class PullbackMetric(RiemannianMetric):
@@ -52,6 +52,9 @@ class PullbackMetric(RiemannianMetric):
         :math:`(f*g)_{ij}(p) = <df_p e_i , df_p e_j>`,
         for :math:`e_i, e_j` basis elements of :math:`M`.
 
+        They are computed from the metric matrix of the embedding metric
+        if it is implemented, and from its inner product otherwise.
+
         Parameters
         ----------
         base_point : array-like, shape=[..., dim]
@@ -63,46 +66,56 @@ class PullbackMetric(RiemannianMetric):
         mat : array-like, shape=[..., dim, dim]
             Inner-product matrix.
         """
-        dim, dim_embedding = self._space.dim, self._space.embedding_space.dim
-        is_vec = check_is_batch(self._space.point_ndim, base_point)
-
+        embedding_metric = self._space.embedding_space.metric
         immersed_base_point = self._space.immersion(base_point)
         jacobian_immersion = self._space.jacobian_immersion(base_point)
-
-        basis_elements = gs.eye(dim)
-
-        if is_vec:
-            reshaped_jacobian_immersion = gs.reshape(jacobian_immersion, (-1, dim))
-            reshaped_immersed_basis_elements = gs.matvec(
-                reshaped_jacobian_immersion, basis_elements
+        try:
+            embedding_metric_matrix = embedding_metric.metric_matrix(
+                immersed_base_point
             )
-            immersed_basis_elements = gs.moveaxis(
-                gs.reshape(reshaped_immersed_basis_elements, (dim, -1, dim_embedding)),
-                0,
-                1,
+        except NotImplementedError:
+            return self._metric_matrix_from_inner_product(
+                immersed_base_point, jacobian_immersion
             )
 
-        else:
-            immersed_basis_elements = gs.matvec(jacobian_immersion, basis_elements)
-
-        elems = {}
-        for i in range(dim):
-            for j in range(i, dim):
-                elem = self._space.embedding_space.metric.inner_product(
-                    immersed_basis_elements[..., i, :],
-                    immersed_basis_elements[..., j, :],
-                    immersed_base_point,
-                )
-                elems[(i, j)] = elem
-
-        mat = []
-        for i in range(dim):
-            for j in range(dim):
-                elem = elems[(i, j)] if j > i else elems[(j, i)]
-                mat.append(elem)
-
-        shape = (-1, dim, dim) if is_vec else (dim, dim)
-        return gs.reshape(gs.stack(mat, axis=-1), shape)
+        return gs.einsum(
+            "...ai,...ab,...bj->...ij",
+            jacobian_immersion,
+            embedding_metric_matrix,
+            jacobian_immersion,
+        )
+
+    def _metric_matrix_from_inner_product(
+        self, immersed_base_point, jacobian_immersion
+    ):
+        """Metric matrix from the inner product of the embedding metric.
+
+        Used when the embedding metric does not implement `metric_matrix`.
+
+        Parameters
+        ----------
+        immersed_base_point : array-like, shape=[..., dim_embedding]
+            Immersed base point.
+        jacobian_immersion : array-like, shape=[..., dim_embedding, dim]
+            Jacobian of the immersion at base point.
+
+        Returns
+        -------
+        mat : array-like, shape=[..., dim, dim]
+            Inner-product matrix.
+        """
+        rows, cols = gs.triu_indices(self._space.dim)
+        elems = [
+            self._space.embedding_space.metric.inner_product(
+                jacobian_immersion[..., :, i],
+                jacobian_immersion[..., :, j],
+                immersed_base_point,
+            )
+            for i, j in zip(rows, cols)
+        ]
+        return geometry.symmetric_matrices.SymmetricMatrices.matrix_representation(
+            gs.stack(elems, axis=-1)
+        )
 
     def inner_product_derivative_matrix(self, base_point):
         r"""Compute the inner-product derivative matrix.
@@ -154,20 +154,22 @@ class RiemannianMetric(Connection, ABC):
         christoffels: array-like, shape=[..., dim, dim, dim]
             Christoffel symbols, where the contravariant index is first.
         """
-        cometric_mat_at_point = self.cometric_matrix(base_point)
+        metric_mat_at_point = self.metric_matrix(base_point)
         metric_derivative_at_point = self.inner_product_derivative_matrix(base_point)
 
-        term_1 = gs.einsum(
-            "...lk,...jli->...kij", cometric_mat_at_point, metric_derivative_at_point
+        # gather the three Koszul terms, indexed as [..., l, i, j], and apply
+        # the cometric to them by solving against the metric matrix
+        koszul_terms = (
+            gs.moveaxis(metric_derivative_at_point, -3, -1)
+            + metric_derivative_at_point
+            - gs.moveaxis(metric_derivative_at_point, -1, -3)
         )
-        term_2 = gs.einsum(
-            "...lk,...lij->...kij", cometric_mat_at_point, metric_derivative_at_point
-        )
-        term_3 = -gs.einsum(
-            "...lk,...ijl->...kij", cometric_mat_at_point, metric_derivative_at_point
+        christoffels = gs.linalg.solve(
+            metric_mat_at_point,
+            gs.reshape(koszul_terms, koszul_terms.shape[:-2] + (-1,)),
         )
 
-        return 0.5 * (term_1 + term_2 + term_3)
+        return 0.5 * gs.reshape(christoffels, koszul_terms.shape)
 
     def inner_product(self, tangent_vec_a, tangent_vec_b, base_point=None):
         """Inner product between two tangent vectors at a base point.
@@ -187,8 +189,9 @@ class RiemannianMetric(Connection, ABC):
             Inner-product.
         """
         inner_prod_mat = self.metric_matrix(base_point)
-        aux = gs.einsum("...j,...jk->...k", tangent_vec_a, inner_prod_mat)
-        return gs.dot(aux, tangent_vec_b)
+        return gs.einsum(
+            "...j,...jk,...k->...", tangent_vec_a, inner_prod_mat, tangent_vec_b
+        )
 
     def inner_coproduct(self, cotangent_vec_a, cotangent_vec_b, base_point=None):
         """Compute inner coproduct between two cotangent vectors at base point.
@@ -209,10 +212,12 @@ class RiemannianMetric(Connection, ABC):
         inner_coproduct : float
             Inner coproduct between the two cotangent vectors.
         """
-        vector_2 = gs.einsum(
-            "...ij,...j->...i", self.cometric_matrix(base_point), cotangent_vec_b
+        return gs.einsum(
+            "...i,...ij,...j->...",
+            cotangent_vec_a,
+            self.cometric_matrix(base_point),
+            cotangent_vec_b,
         )
-        return gs.dot(cotangent_vec_a, vector_2)
 
     def hamiltonian(self, state):
         r"""Compute the hamiltonian energy associated to the cometric.
@@ -226,16 +231,17 @@ class RiemannianMetric(Connection, ABC):
 
         Parameters
         ----------
-        state : tuple of arrays
+        state : array-like, shape=[..., 2, dim]
             Position and momentum variables. The position is a point on the
             manifold, while the momentum is cotangent vector.
 
         Returns
         -------
-        energy : float
+        energy : array-like, shape=[...,]
             Hamiltonian energy at `state`.
         """
-        position, momentum = state
+        position = state[..., 0, :]
+        momentum = state[..., 1, :]
         return 1.0 / 2 * self.inner_coproduct(momentum, momentum, position)
 
     def squared_norm(self, vector, base_point=None):
@@ -424,9 +430,10 @@ class RiemannianMetric(Connection, ABC):
         points : array-like, shape=[n_samples, dim]
             Set of points in the manifold.
         n_jobs : int
-            Number of jobs to run in parallel, using joblib. Note that a
-            higher number of jobs may not be beneficial when one computation
-            of a geodesic distance is cheap.
+            Number of jobs to run in parallel, using joblib. If 1, all the
+            distances are computed at once in a single vectorized call.
+            Note that a higher number of jobs may not be beneficial when one
+            computation of a geodesic distance is cheap.
             Optional. Default: 1.
         **joblib_kwargs : dict
             Keyword arguments to joblib.Parallel
@@ -443,6 +450,13 @@ class RiemannianMetric(Connection, ABC):
         n_samples = points.shape[0]
         rows, cols = gs.triu_indices(n_samples)
 
+        if n_jobs == 1:
+            return (
+                geometry.symmetric_matrices.SymmetricMatrices.matrix_representation(
+                    self.dist(points[rows], points[cols])
+                )
+            )
+
         @joblib.delayed
         @joblib.wrap_non_picklable_objects
         def pickable_dist(x, y):
@@ -472,15 +486,12 @@ class RiemannianMetric(Connection, ABC):
         diameter : float
             Distance between two farthest points.
         """
-        diameter = 0.0
         n_points = points.shape[0]
+        if n_points < 2:
+            return 0.0
 
-        for i in range(n_points - 1):
-            dist_to_neighbors = self.dist(points[i, :], points[i + 1 :, :])
-            dist_to_farthest_neighbor = gs.amax(dist_to_neighbors)
-            diameter = gs.maximum(diameter, dist_to_farthest_neighbor)
-
-        return diameter
+        rows, cols = gs.triu_indices(n_points, k=1)
+        return gs.amax(self.dist(points[rows], points[cols]))
 
     def closest_neighbor_index(self, point, neighbors):
         """Closest neighbor of point among neighbors.
@@ -494,22 +505,21 @@ class RiemannianMetric(Connection, ABC):
 
         Returns
         -------
-        closest_neighbor_index : int
+        closest_neighbor_index : int or array-like, shape=[...]
             Index of closest neighbor.
         """
         n_points = point.shape[0] if gs.ndim(point) == gs.ndim(neighbors) else 1
         n_neighbors = neighbors.shape[0]
 
         if n_points > 1 and n_neighbors > 1:
-            neighbors = gs.repeat(neighbors, n_points, axis=0)
-
-            point = gs.concatenate([point for _ in range(n_neighbors)])
+            # pair every point with every neighbor, point-major, so that a
+            # single call to dist covers the whole cross-product
+            point = gs.repeat(point, n_neighbors, axis=0)
+            neighbors = gs.tile(neighbors, (n_points,) + (1,) * (neighbors.ndim - 1))
 
         closest_neighbor_index = gs.argmin(
-            gs.transpose(
-                gs.reshape(self.dist(point, neighbors), (n_neighbors, n_points)),
-            ),
-            axis=1,
+            gs.reshape(self.dist(point, neighbors), (n_points, n_neighbors)),
+            axis=-1,
         )
 
         if n_points == 1:
@@ -518,25 +528,34 @@ class RiemannianMetric(Connection, ABC):
         return closest_neighbor_index
 
     def normal_basis(self, basis, base_point=None):
-        """Normalize the basis with respect to the metric.
+        """Orthonormalize the basis with respect to the metric.
 
-        This corresponds to a renormalization of each basis vector.
+        This corresponds to a Gram-Schmidt process on the basis vectors,
+        carried out through the Cholesky factor of their Gram matrix.
+        An orthogonal basis is only renormalized.
 
         Parameters
         ----------
-        basis : array-like, shape=[dim, dim]
-            Matrix of a metric.
-        base_point : array-like, shape=[dim]
+        basis : array-like, shape=[dim, *shape]
+            Basis of the tangent space at base point.
+        base_point : array-like, shape=[*shape]
             Base point.
 
         Returns
         -------
-        basis : array-like, shape=[dim, n, n]
-            Normal basis.
+        basis : array-like, shape=[dim, *shape]
+            Orthonormal basis.
         """
-        norms = self.squared_norm(basis, base_point)
+        n_basis = basis.shape[0]
+        rows, cols = gs.triu_indices(n_basis)
+        gram = geometry.symmetric_matrices.SymmetricMatrices.matrix_representation(
+            self.inner_product(basis[rows], basis[cols], base_point)
+        )
 
-        return gs.einsum("i, ikl->ikl", 1.0 / gs.sqrt(norms), basis)
+        normal_basis = gs.linalg.solve(
+            gs.linalg.cholesky(gram), gs.reshape(basis, (n_basis, -1))
+        )
+        return gs.reshape(normal_basis, basis.shape)
 
     def covariant_riemann_tensor(self, base_point=None):
         r"""Compute purely covariant version of Riemannian tensor at base_point.
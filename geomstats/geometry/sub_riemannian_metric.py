@@ -91,9 +91,7 @@ class SubRiemannianMetric:
 
         frame = self.frame(base_point)
         coefs = gs.einsum("...i,...ij->...j", cotangent_vec, frame)
-        coefs_on_frame = gs.einsum("...j,...ij->...ij", coefs, frame)
-
-        return gs.einsum("...ij->...i", coefs_on_frame)
+        return gs.einsum("...j,...ij->...i", coefs, frame)
 
     def _get_method(self, method_name):
         return getattr(self, f"_{method_name}_{self._def_type}")
@@ -103,10 +101,12 @@ class SubRiemannianMetric:
         return gs.einsum("...i,...i -> ...", cotangent_vec_a, sharp)
 
     def _inner_coproduct_cometric(self, cotangent_vec_a, cotangent_vec_b, base_point):
-        C_b = gs.einsum(
-            "...ij,...j->...i", self.cometric_matrix(base_point), cotangent_vec_b
+        return gs.einsum(
+            "...i,...ij,...j->...",
+            cotangent_vec_a,
+            self.cometric_matrix(base_point),
+            cotangent_vec_b,
         )
-        return gs.einsum("...i,...i->...", cotangent_vec_a, C_b)
 
     def inner_coproduct(self, cotangent_vec_a, cotangent_vec_b, base_point):
         """Compute inner coproduct between two cotangent vectors at base point.
@@ -132,7 +132,8 @@ class SubRiemannianMetric:
         )
 
     def _hamiltonian_frame(self, state):
-        position, momentum = state
+        position = state[..., 0, :]
+        momentum = state[..., 1, :]
 
         inner_products = gs.einsum("...i,...ij->...j", momentum, self.frame(position))
 
@@ -142,7 +143,8 @@ class SubRiemannianMetric:
         return out
 
     def _hamiltonian_cometric(self, state):
-        position, momentum = state
+        position = state[..., 0, :]
+        momentum = state[..., 1, :]
         return 0.5 * self.inner_coproduct(momentum, momentum, position)
 
     def hamiltonian(self, state):
@@ -157,9 +159,9 @@ class SubRiemannianMetric:
 
         Parameters
         ----------
-        state : array-like, shape=[[..., dim], [..., dim]]
-            The first array in 'state' contains positions, the second contains
-            covectors (momentums).
+        state : array-like, shape=[..., 2, dim]
+            Positions and covectors (momentums), stacked along the
+            second to last axis.
 
         Returns
         -------
@@ -179,8 +181,9 @@ class SubRiemannianMetric:
 
         Returns
         -------
-        vector : array-like, shape=[, 2*dim]
-            The symplectic gradient of the Hamiltonian.
+        vector : callable
+            Given a state of shape=[..., 2, dim], returns the symplectic
+            gradient of the Hamiltonian, of the same shape.
         """
         value_and_grad = gs.autodiff.value_and_grad(
             hamiltonian,
@@ -189,29 +192,39 @@ class SubRiemannianMetric:
 
         def vector(x):
             """Compute symplectic gradient at x."""
-            _, (h_q, h_p) = value_and_grad(x)
-            return gs.array([h_p, -h_q])
+            _, grad = value_and_grad(x)
+            return gs.stack([grad[..., 1, :], -grad[..., 0, :]], axis=-2)
 
         return vector
 
     def _symp_euler_frame(self, hamiltonian, step_size):
+        symp_grad = self.symp_grad(hamiltonian)
+
         def step(state):
-            position, momentum = state
+            position = state[..., 0, :]
+            momentum = state[..., 1, :]
             dq = self.sr_sharp(base_point=position, cotangent_vec=momentum)
-            y = gs.array([position + step_size * dq, momentum])
-            _, dp = self.symp_grad(hamiltonian)(y)
-            return gs.array([position + step_size * dq, momentum + step_size * dp])
+            y = gs.stack([position + step_size * dq, momentum], axis=-2)
+            dp = symp_grad(y)[..., 1, :]
+            return gs.stack(
+                [position + step_size * dq, momentum + step_size * dp], axis=-2
+            )
 
         return step
 
     def _symp_euler_cometric(self, hamiltonian, step_size):
+        symp_grad = self.symp_grad(hamiltonian)
+
         def step(state):
             r"""Compute an integration step from state."""
-            position, momentum = state
-            dq, _ = self.symp_grad(hamiltonian)(state)
-            y = gs.array([position + step_size * dq, momentum])
-            _, dp = self.symp_grad(hamiltonian)(y)
-            return gs.array([position + step_size * dq, momentum + step_size * dp])
+            position = state[..., 0, :]
+            momentum = state[..., 1, :]
+            dq = symp_grad(state)[..., 0, :]
+            y = gs.stack([position + step_size * dq, momentum], axis=-2)
+            dp = symp_grad(y)[..., 1, :]
+            return gs.stack(
+                [position + step_size * dq, momentum + step_size * dp], axis=-2
+            )
 
         return step
 
@@ -310,11 +323,11 @@ class SubRiemannianMetric:
         base_point = gs.broadcast_to(base_point, cotangent_vec.shape)
 
         # TODO: integrate; allow euler
-        initial_state = gs.stack([base_point, cotangent_vec])
+        initial_state = gs.stack([base_point, cotangent_vec], axis=-2)
 
         flow = self.symp_flow(self.hamiltonian, n_steps=n_steps)
 
-        return flow(initial_state)[-1][0]
+        return flow(initial_state)[-1][..., 0, :]
 
     def geodesic(self, initial_point, initial_cotangent_vec, n_steps=20):
         """Generate parameterized function for the normal geodesic curve.
@@ -94,9 +94,7 @@ class TestCase:
 
     def _test_vectorization(self, vec_data, test_fnc_name=None):
         if test_fnc_name is None:
-            curframe = inspect.currentframe()
-            calframe = inspect.getouterframes(curframe, 2)
-            test_fnc_name = calframe[1][3][:-4]
+            test_fnc_name = inspect.currentframe().f_back.f_code.co_name[:-4]
 
         test_fnc = getattr(self, test_fnc_name)
 
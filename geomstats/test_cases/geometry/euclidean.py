@@ -42,6 +42,31 @@ class EuclideanMetricTestCase(RiemannianMetricTestCase):
         expected = gs.zeros(batch_shape + 3 * (self.space.dim,))
         self.assertAllClose(res, expected, atol=atol)
 
+    @pytest.mark.random
+    def test_riemann_tensor_is_zeros(self, n_points, atol):
+        base_point = self.data_generator.random_point(n_points)
+
+        res = self.space.metric.riemann_tensor(base_point)
+
+        batch_shape = (n_points,) if n_points > 1 else ()
+        expected = gs.zeros(batch_shape + 4 * (self.space.dim,))
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_normal_basis_is_orthonormal(self, atol):
+        base_point = self.data_generator.random_point()
+        # skewed basis, not orthogonal for any of the tested metrics
+        skewed_basis = gs.cumsum(self.space.basis, axis=0)
+        basis = self.space.metric.normal_basis(skewed_basis, base_point)
+
+        res = gs.stack(
+            [
+                self.space.metric.inner_product(basis_vector, basis, base_point)
+                for basis_vector in basis
+            ]
+        )
+        self.assertAllClose(res, gs.eye(self.space.dim), atol=atol)
+
 
 class CanonicalEuclideanMetricTestCase(EuclideanMetricTestCase):
     @pytest.mark.random
@@ -66,6 +66,14 @@ class PullbackMetricTestCase(RiemannianMetricTestCase):
         res = gs.linalg.norm(mean_curvature)
         self.assertAllClose(res, expected, atol=atol)
 
+    def test_metric_matrix_from_inner_product(self, base_point, atol):
+        res = self.space.metric._metric_matrix_from_inner_product(
+            self.space.immersion(base_point),
+            self.space.jacobian_immersion(base_point),
+        )
+        expected = self.space.metric.metric_matrix(base_point)
+        self.assertAllClose(res, expected, atol=atol)
+
 
 class PullbackDiffeoMetricTestCase(RiemannianMetricTestCase):
     pass
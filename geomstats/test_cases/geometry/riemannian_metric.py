@@ -177,6 +177,23 @@ class RiemannianMetricTestCase(DistTestCaseMixins, ConnectionTestCase):
         dist_ = self.space.metric.dist(point_a, point_b)
         self.assertAllClose(dist_, log_norm, atol=atol)
 
+    @pytest.mark.random
+    def test_dist_pairwise_is_dist(self, n_points, atol):
+        """Check pairwise distance matrix matches distances to each point.
+
+        Parameters
+        ----------
+        n_points : int
+            Number of random points to generate.
+        atol : float
+            Absolute tolerance.
+        """
+        points = self.data_generator.random_point(n_points)
+
+        res = self.space.metric.dist_pairwise(points)
+        expected = gs.stack([self.space.metric.dist(point, points) for point in points])
+        self.assertAllClose(res, expected, atol=atol)
+
     def test_diameter(self, points, expected, atol):
         res = self.space.metric.diameter(points)
         self.assertAllClose(res, expected, atol=atol)
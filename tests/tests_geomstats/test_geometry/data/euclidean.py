@@ -24,6 +24,12 @@ class EuclideanMetricTestData(RiemannianMetricTestData):
     def christoffels_are_zeros_test_data(self):
         return self.generate_random_data()
 
+    def riemann_tensor_is_zeros_test_data(self):
+        return self.generate_random_data()
+
+    def normal_basis_is_orthonormal_test_data(self):
+        return self.generate_tests([dict()])
+
 
 class CanonicalEuclideanMetricTestData(EuclideanMetricTestData):
     fail_for_autodiff_exceptions = False
@@ -84,7 +90,7 @@ class CanonicalEuclideanMetric2TestData(TestData):
     def hamiltonian_test_data(self):
         data = [
             dict(
-                state=(gs.array([1.0, 2.0]), gs.array([1.0, 2.0])),
+                state=gs.array([[1.0, 2.0], [1.0, 2.0]]),
                 expected=gs.array(2.5),
             )
         ]
@@ -139,3 +145,26 @@ class CanonicalEuclideanMetric2TestData(TestData):
             )
         ]
         return self.generate_tests(data)
+
+    def normal_basis_test_data(self):
+        data = [
+            dict(
+                basis=gs.array([[1.0, 1.0], [0.0, 1.0]]),
+                base_point=None,
+                expected=gs.array([[1.0, 1.0], [-1.0, 1.0]]) / gs.sqrt(2.0),
+            ),
+        ]
+        return self.generate_tests(data)
+
+    def diameter_test_data(self):
+        data = [
+            dict(
+                points=gs.array([[2.0, 1.0], [-2.0, -4.0], [-5.0, 1.0], [8.0, -1.0]]),
+                expected=gs.sqrt(gs.array(173.0)),
+            ),
+            dict(
+                points=gs.array([[2.0, 1.0]]),
+                expected=gs.array(0.0),
+            ),
+        ]
+        return self.generate_tests(data)
@@ -37,6 +37,7 @@ class FullRankCorrelationAffineQuotientMetricTestData(QuotientMetricTestData):
 
     tolerances = {
         "dist_point_to_itself_is_zero": {"atol": 1e-4},
+        "dist_pairwise_is_dist": {"atol": 1e-4},
         "geodesic_bvp_vec": {"atol": 1e-4},
         "geodesic_bvp_reverse": {"atol": 1e-4},
         "geodesic_boundary_points": {"atol": 1e-4},
@@ -232,7 +232,7 @@ class Hypersphere2ExtrinsicMetricTestData(TestData):
     def hamiltonian_test_data(self):
         data = [
             dict(
-                state=(gs.array([0.0, 0.0, 1.0]), gs.array([1.0, 2.0, 1.0])),
+                state=gs.array([[0.0, 0.0, 1.0], [1.0, 2.0, 1.0]]),
                 expected=gs.array(3.0),
             )
         ]
@@ -128,6 +128,7 @@ class InvariantMetricMatrixSETestData(InvariantMetricMatrixTestData):
         "dist_vec": {"atol": _atol},
         "dist_is_log_norm": {"atol": _atol},
         "dist_point_to_itself_is_zero": {"atol": _atol},
+        "dist_pairwise_is_dist": {"atol": _atol},
         "dist_is_symmetric": {"atol": _atol},
         "dist_triangle_inequality": {"atol": _atol},
         "exp_belongs": {"atol": _atol},
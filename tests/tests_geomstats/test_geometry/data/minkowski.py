@@ -25,6 +25,7 @@ class MinkowskiMetricTestData(EuclideanMetricTestData):
         "norm_is_positive",
         "normalize_vec",
         "normalize_is_unitary",
+        "normal_basis_is_orthonormal",
         "norm_vec",
         "dist_vec",
         "parallel_transport_bvp_norm",
@@ -222,6 +222,13 @@ class SphereIntrinsicTestData(TestData):
 class CircleIntrinsicMetricTestData(TestData):
     fail_for_autodiff_exceptions = False
 
+    def metric_matrix_from_inner_product_test_data(self):
+        data = [
+            dict(base_point=gs.array([1.0])),
+            dict(base_point=gs.array([[0.0], [1.0], [4.0]])),
+        ]
+        return self.generate_tests(data)
+
     def metric_matrix_test_data(self):
         base_points = [gs.array([0.0]), gs.array([1.0]), gs.array([4.0])]
         data = []
@@ -283,6 +290,13 @@ class CircleIntrinsicMetricTestData(TestData):
 class SphereIntrinsicMetricTestData(TestData):
     fail_for_autodiff_exceptions = False
 
+    def metric_matrix_from_inner_product_test_data(self):
+        data = [
+            dict(base_point=gs.array([0.3, 0.8])),
+            dict(base_point=gs.array([[0.0, 0.0], [1.0, 1.0], [0.3, 0.8]])),
+        ]
+        return self.generate_tests(data)
+
     def metric_matrix_test_data(self):
         base_points = [gs.array([0.0, 0.0]), gs.array([1.0, 1.0]), gs.array([0.3, 0.8])]
         data = []
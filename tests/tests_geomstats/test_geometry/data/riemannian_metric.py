@@ -56,6 +56,9 @@ class RiemannianMetricTestData(DistMixinsTestData, ConnectionTestData):
     def dist_is_log_norm_test_data(self):
         return self.generate_random_data()
 
+    def dist_pairwise_is_dist_test_data(self):
+        return self.generate_tests([dict(n_points=self.N_RANDOM_POINTS[-1])])
+
     def covariant_riemann_tensor_vec_test_data(self):
         return self.generate_vec_data()
 